@@ -2,11 +2,17 @@ import base64
 import sys
 from pathlib import Path
 import traceback
+from types import MappingProxyType
 from typing import List, Optional, Tuple, Dict
 
 import click
 import inquirer
 import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings not compiled in
+    from yaml import SafeLoader as _YamlLoader
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -32,6 +38,55 @@ class ConfigError(Exception):
     pass
 
 
+def _fast_yaml_load(yaml_path: Path) -> dict:
+    """Parse a YAML file with the libyaml C loader when available."""
+    # Binary mode lets libyaml consume raw bytes without a Python-side decode pass.
+    with open(yaml_path, "rb") as stream:
+        return yaml.load(stream, Loader=_YamlLoader)
+
+
+# Parsed YAML documents keyed by path, invalidated when the file's
+# (mtime, size) stat signature changes. Entries are stored frozen so no
+# caller can mutate the cached copy behind another's back.
+_YAML_CACHE: Dict[Path, tuple] = {}
+
+
+def _freeze(obj):
+    """Recursively convert a parsed YAML tree into an immutable snapshot."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj):
+    """Rebuild plain dicts/lists from a frozen snapshot.
+
+    Structural copy of known shapes only — much cheaper than the generic
+    dispatch and memo bookkeeping of copy.deepcopy.
+    """
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+def cached_yaml_load(yaml_path: Path) -> dict:
+    """Load a YAML file, reusing the parsed result while the file is unchanged."""
+    st = yaml_path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _YAML_CACHE.get(yaml_path)
+    if hit is not None and hit[:2] == key:
+        # Validators mutate the returned dict (defaults, normalization),
+        # so hand out a thawed working copy rather than the snapshot.
+        return _thaw(hit[2])
+    data = _fast_yaml_load(yaml_path)
+    _YAML_CACHE[yaml_path] = (*key, _freeze(data))
+    return data
+
+
 class ConfigValidator:
     """Validates configuration and secrets YAML files."""
 
@@ -77,8 +132,7 @@ class ConfigValidator:
     def load_yaml(yaml_path: Path) -> dict:
         """Load and parse a YAML file."""
         try:
-            with open(yaml_path, "r") as stream:
-                return yaml.safe_load(stream)
+            return cached_yaml_load(yaml_path)
         except yaml.YAMLError as exc:
             raise ConfigError(f"Error reading YAML file {yaml_path}: {exc}")
         except FileNotFoundError:
@@ -186,12 +240,22 @@ class FileManager:
 
     REQUIRED_FILES = [SECRETS_YAML, WORK_PREFERENCES_YAML, PLAIN_TEXT_RESUME_YAML]
 
+    # (path, mtime_ns)-keyed memos so long-lived scheduled processes that
+    # re-enter config loading do not re-scan an unchanged data folder.
+    _folder_cache: Dict[tuple, Tuple[Path, Path, Path, Path]] = {}
+    _uploads_cache: Dict[tuple, Dict[str, Path]] = {}
+
     @staticmethod
     def validate_data_folder(app_data_folder: Path) -> Tuple[Path, Path, Path, Path]:
         """Validate the existence of the data folder and required files."""
         if not app_data_folder.is_dir():
             raise FileNotFoundError(f"Data folder not found: {app_data_folder}")
 
+        cache_key = (app_data_folder, app_data_folder.stat().st_mtime_ns)
+        cached = FileManager._folder_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         missing_files = [file for file in FileManager.REQUIRED_FILES if not (app_data_folder / file).exists()]
         if missing_files:
             raise FileNotFoundError(f"Missing files in data folder: {', '.join(missing_files)}")
@@ -199,12 +263,14 @@ class FileManager:
         output_folder = app_data_folder / "output"
         output_folder.mkdir(exist_ok=True)
 
-        return (
+        result = (
             app_data_folder / SECRETS_YAML,
             app_data_folder / WORK_PREFERENCES_YAML,
             app_data_folder / PLAIN_TEXT_RESUME_YAML,
             output_folder,
         )
+        FileManager._folder_cache[cache_key] = result
+        return result
 
     @staticmethod
     def get_uploads(plain_text_resume_file: Path) -> Dict[str, Path]:
@@ -212,9 +278,15 @@ class FileManager:
         if not plain_text_resume_file.exists():
             raise FileNotFoundError(f"Plain text resume file not found: {plain_text_resume_file}")
 
+        cache_key = (plain_text_resume_file, plain_text_resume_file.stat().st_mtime_ns)
+        cached = FileManager._uploads_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         uploads = {"plainTextResume": plain_text_resume_file}
 
-        return uploads
+        FileManager._uploads_cache[cache_key] = uploads
+        return dict(uploads)
 
 
 def create_cover_letter(parameters: dict, llm_api_key: str):
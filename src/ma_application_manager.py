@@ -2,17 +2,22 @@
 M&A Application Manager
 Coordinates the entire M&A job application process
 """
+import asyncio
+import base64
+import hashlib
 import json
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import smtplib
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
-from email.mime.base import MimeBase
-from email import encoders
+from email.message import EmailMessage
 
 from src.logging import logger
 from src.ma_job_scraper import MAJobScraper, MAJobListing
@@ -22,6 +27,24 @@ from src.libs.resume_and_cover_builder import ResumeFacade, ResumeGenerator, Sty
 from src.resume_schemas.resume import Resume
 from src.utils.chrome_utils import init_browser
 
+# Follow-up templates, built once; the send path only fills in the blanks
+_FOLLOW_UP_SUBJECT = "Following up on {title} application"
+
+_FOLLOW_UP_BODY = """
+        Dear Hiring Manager,
+
+        I hope this email finds you well. I wanted to follow up on my recent application for the {title} position at {company}.
+
+        I am very excited about the opportunity to contribute to your M&A team and would welcome the chance to discuss how my experience in financial modeling, due diligence, and deal execution can add value to your organization.
+
+        I would be happy to provide any additional information you might need or to schedule a conversation at your convenience.
+
+        Thank you for your time and consideration.
+
+        Best regards,
+        [Your Name]
+        """
+
 @dataclass
 class ApplicationRecord:
     """Record of a job application"""
@@ -38,16 +61,42 @@ class ApplicationRecord:
 class MAApplicationManager:
     """Manages the complete M&A job application workflow"""
     
+    # Read connections kept per manager; SQLite is single-writer/multi-reader
+    READ_POOL_SIZE = 2
+
+    # Concurrent submissions in flight; the work is I/O-bound so overlap pays
+    MAX_CONCURRENT_SUBMISSIONS = 5
+
+    # How long cached statistics stay valid between writes, in seconds
+    STATS_CACHE_TTL = 60.0
+
+    # Longest a run will wait for queued follow-up emails before returning
+    MAIL_DRAIN_TIMEOUT = 120.0
+
     def __init__(self, config: Dict, api_key: str):
         self.config = config
         self.api_key = api_key
         self.db_path = Path("data_folder/output/ma_applications.db")
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._read_pool: queue.Queue = queue.Queue()
+        self._pending_records: List[tuple] = []
+        self._stats_cache: Optional[Tuple[float, Dict]] = None
+        self._report_cache: Optional[Tuple[float, str]] = None
         self.setup_database()
         
         # Initialize components
         self.job_scraper = MAJobScraper(config)
         self.job_filter = MAJobFilter()
         self.resume_optimizer = MAResumeOptimizer()
+
+        # Expensive per-submission objects, built lazily and reused for the
+        # whole session (YAML parse, style enumeration, browser cold start)
+        self._resume: Optional[Resume] = None
+        self._style_manager: Optional[StyleManager] = None
+        self._resume_generator: Optional[ResumeGenerator] = None
+        self._driver = None
+        self._driver_lock = threading.Lock()
         
         # Email configuration
         self.email_config = {
@@ -61,13 +110,34 @@ class MAApplicationManager:
         self.daily_application_limit = config.get('daily_application_limit', 15)
         self.weekly_application_limit = config.get('weekly_application_limit', 75)
 
+        # Follow-up emails run on a background worker that keeps one
+        # authenticated SMTP session alive across the whole batch
+        self._mail_queue: queue.Queue = queue.Queue()
+        self._mail_worker = threading.Thread(
+            target=self._mail_worker_loop, name="ma-mail-worker", daemon=True
+        )
+        self._mail_worker.start()
+
     def setup_database(self):
-        """Initialize SQLite database for tracking applications"""
+        """Initialize SQLite database and the persistent connections"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+
+        # One long-lived writer reused by every mutation; per-call
+        # connect/close paid three file opens (db, -wal, -shm) per query.
+        self._write_conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA mmap_size=268435456",
+            "PRAGMA cache_size=-65536",
+        ):
+            self._write_conn.execute(pragma)
+
+        cursor = self._write_conn.cursor()
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS applications (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -98,10 +168,60 @@ class MAApplicationManager:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Index the hot lookups: date-window limit checks, (title, company)
+        # duplicate checks, and the follow-up scan (partial index matches
+        # that query's predicate exactly)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_app_date ON applications(application_date)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_app_title_company ON applications(job_title, company)"
+        )
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_app_status_follow 
+            ON applications(status, follow_up_sent, application_date) 
+            WHERE status='submitted' AND follow_up_sent=0
+        ''')
+
+        cursor.close()
+
+        # Small pool of read-only connections for the query helpers
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
+        for _ in range(self.READ_POOL_SIZE):
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            self._read_pool.put(conn)
+
         logger.info("Database initialized for M&A application tracking")
 
+    @contextmanager
+    def _writer(self):
+        """Yield a cursor on the shared writer connection.
+
+        The lock is held for the whole block so the mail worker's updates
+        can never interleave with (and get rolled back alongside) a batch
+        transaction open on the same autocommit connection.
+        """
+        with self._write_lock:
+            cursor = self._write_conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool and yield a cursor."""
+        conn = self._read_pool.get()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self._read_pool.put(conn)
+
     def run_daily_job_search(self) -> Dict:
         """Execute daily M&A job search and application process"""
         logger.info("Starting daily M&A job search and application process")
@@ -115,8 +235,11 @@ class MAApplicationManager:
         }
         
         try:
-            # Check daily application limits
-            if not self._can_submit_applications():
+            # Check daily application limits; one round-trip also loads the
+            # applied set so the loop below never re-queries per job
+            daily_count, weekly_count, applied_set = self._load_application_state()
+            if (daily_count >= self.daily_application_limit or
+                    weekly_count >= self.weekly_application_limit):
                 logger.warning("Daily/weekly application limits reached")
                 return session_stats
             
@@ -134,32 +257,34 @@ class MAApplicationManager:
             prioritized_jobs = self.job_filter.prioritize_applications(filtered_jobs)
             session_stats['high_priority_jobs'] = len(prioritized_jobs)
             
-            # 3. Apply to top jobs
-            applications_submitted = 0
-            for job_data in prioritized_jobs[:self.daily_application_limit]:
-                try:
-                    if self._already_applied(job_data['title'], job_data['company']):
-                        logger.info(f"Already applied to {job_data['title']} at {job_data['company']}")
-                        continue
-                    
-                    success = self._submit_application(job_data)
-                    if success:
-                        applications_submitted += 1
-                        logger.info(f"Successfully applied to {job_data['title']} at {job_data['company']}")
-                    
-                    # Rate limiting
-                    import time
-                    time.sleep(30)  # 30 seconds between applications
-                    
-                except Exception as e:
-                    error_msg = f"Error applying to {job_data.get('title', 'Unknown')}: {e}"
-                    logger.error(error_msg)
-                    session_stats['errors'].append(error_msg)
-            
+            # 3. Apply to top jobs concurrently, capped by the remaining allowance
+            remaining = min(self.daily_application_limit - daily_count,
+                            self.weekly_application_limit - weekly_count)
+            candidates = []
+            for job_data in prioritized_jobs:
+                if len(candidates) >= remaining:
+                    break
+                applied_key = self._job_key(job_data['company'], job_data['title'])
+                if applied_key in applied_set:
+                    logger.info(f"Already applied to {job_data['title']} at {job_data['company']}")
+                    continue
+                applied_set.add(applied_key)
+                job_data['_job_key'] = applied_key
+                candidates.append(job_data)
+
+            applications_submitted, errors = asyncio.run(self._submit_candidates(candidates))
+            session_stats['errors'].extend(errors)
             session_stats['applications_submitted'] = applications_submitted
+
+            # Persist the whole batch in one transaction
+            self._flush_application_records()
             
-            # 4. Send follow-up emails for previous applications
+            # 4. Send follow-up emails for previous applications; wait for
+            # the worker to drain so a run that exits right after (single
+            # --mode run invocations) does not drop the queued batch with
+            # the daemon thread
             self._send_follow_up_emails()
+            self._drain_mail_queue()
             
             # 5. Save session statistics
             self._save_session_stats(session_stats)
@@ -170,33 +295,47 @@ class MAApplicationManager:
         
         finally:
             self.job_scraper.cleanup()
+            self.cleanup()
         
         logger.info(f"Daily job search completed: {session_stats}")
         return session_stats
 
-    def _can_submit_applications(self) -> bool:
-        """Check if we can submit more applications based on limits"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Check daily limit
+    @staticmethod
+    def _job_key(company: str, title: str) -> str:
+        """Stable dedup key for a (company, title) pair"""
+        return hashlib.blake2b(
+            f"{company}\x00{title}".encode(), digest_size=12
+        ).hexdigest()
+
+    def _load_application_state(self) -> Tuple[int, int, Set[str]]:
+        """Load today's count, this week's count and the applied set at once"""
         today = datetime.now().date()
-        cursor.execute(
-            "SELECT COUNT(*) FROM applications WHERE DATE(application_date) = ?",
-            (today,)
-        )
-        daily_count = cursor.fetchone()[0]
-        
-        # Check weekly limit
         week_ago = today - timedelta(days=7)
-        cursor.execute(
-            "SELECT COUNT(*) FROM applications WHERE DATE(application_date) > ?",
-            (week_ago,)
-        )
-        weekly_count = cursor.fetchone()[0]
-        
-        conn.close()
-        
+
+        with self._reader() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM applications WHERE DATE(application_date) = ?",
+                (today,)
+            )
+            daily_count = cursor.fetchone()[0]
+
+            cursor.execute(
+                "SELECT COUNT(*) FROM applications WHERE DATE(application_date) > ?",
+                (week_ago,)
+            )
+            weekly_count = cursor.fetchone()[0]
+
+            cursor.execute("SELECT job_title, company FROM applications")
+            applied_set = {
+                self._job_key(company, title) for title, company in cursor.fetchall()
+            }
+
+        return daily_count, weekly_count, applied_set
+
+    def _can_submit_applications(self) -> bool:
+        """Check if we can submit more applications based on limits"""
+        daily_count, weekly_count, _ = self._load_application_state()
+
         can_apply = (daily_count < self.daily_application_limit and 
                     weekly_count < self.weekly_application_limit)
         
@@ -207,27 +346,95 @@ class MAApplicationManager:
 
     def _already_applied(self, job_title: str, company: str) -> bool:
         """Check if we've already applied to this job/company combination"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT COUNT(*) FROM applications WHERE job_title = ? AND company = ?",
-            (job_title, company)
+        with self._reader() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM applications WHERE job_title = ? AND company = ? LIMIT 1",
+                (job_title, company)
+            )
+            return cursor.fetchone() is not None
+
+    async def _submit_candidates(self, candidates: List[Dict]) -> Tuple[int, List[str]]:
+        """Submit applications concurrently under global and per-company caps"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SUBMISSIONS)
+        company_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        async def submit_one(job_data: Dict) -> bool:
+            async with semaphore:
+                # Serialize same-company submissions and space them out so we
+                # never hammer a single employer's site in parallel
+                async with company_locks[job_data.get('company', '')]:
+                    success = await self._submit_application(job_data)
+                    await asyncio.sleep(1)
+                    return success
+
+        results = await asyncio.gather(
+            *[submit_one(job_data) for job_data in candidates],
+            return_exceptions=True
         )
-        count = cursor.fetchone()[0]
-        conn.close()
-        
-        return count > 0
 
-    def _submit_application(self, job_data: Dict) -> bool:
-        """Submit application for a specific M&A job"""
-        try:
-            # Load user resume
+        submitted = 0
+        errors = []
+        for job_data, result in zip(candidates, results):
+            if isinstance(result, BaseException):
+                error_msg = f"Error applying to {job_data.get('title', 'Unknown')}: {result}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+            elif result:
+                submitted += 1
+                logger.info(f"Successfully applied to {job_data['title']} at {job_data['company']}")
+
+        return submitted, errors
+
+    async def _submit_application(self, job_data: Dict) -> bool:
+        """Submit application for a specific M&A job off the event loop"""
+        return await asyncio.to_thread(self._submit_application_sync, job_data)
+
+    def _ensure_resume(self) -> Resume:
+        """Parse the user resume once and reuse it for every submission"""
+        if self._resume is None:
             resume_path = Path("data_folder/plain_text_resume.yaml")
             with open(resume_path, 'r') as f:
-                resume_content = f.read()
-            
-            resume = Resume(resume_content)
+                self._resume = Resume(f.read())
+        return self._resume
+
+    def _ensure_style_manager(self) -> StyleManager:
+        """Build the style manager once, selecting the first available style"""
+        if self._style_manager is None:
+            style_manager = StyleManager()
+            available_styles = style_manager.get_styles()
+            if available_styles:
+                style_manager.set_selected_style(list(available_styles.keys())[0])
+            self._style_manager = style_manager
+        return self._style_manager
+
+    def _ensure_resume_generator(self) -> ResumeGenerator:
+        """Build the resume generator once, bound to the cached resume"""
+        if self._resume_generator is None:
+            resume_generator = ResumeGenerator()
+            resume_generator.set_resume_object(self._ensure_resume())
+            self._resume_generator = resume_generator
+        return self._resume_generator
+
+    def _ensure_driver(self):
+        """Start the browser once; cold start is the dominant per-job cost"""
+        if self._driver is None:
+            self._driver = init_browser()
+        return self._driver
+
+    def cleanup(self):
+        """Release the shared browser driver"""
+        with self._driver_lock:
+            if self._driver is not None:
+                try:
+                    self._driver.quit()
+                except Exception as e:
+                    logger.warning(f"Error closing browser driver: {e}")
+                self._driver = None
+
+    def _submit_application_sync(self, job_data: Dict) -> bool:
+        """Blocking submission work: resume generation plus browser automation"""
+        try:
+            resume = self._ensure_resume()
             
             # Optimize resume for this specific job
             optimized_resume_data = self.resume_optimizer.optimize_resume_for_ma_job(
@@ -235,28 +442,14 @@ class MAApplicationManager:
             )
             
             # Generate tailored resume and cover letter
-            style_manager = StyleManager()
-            available_styles = style_manager.get_styles()
-            if available_styles:
-                # Use first available style
-                first_style = list(available_styles.keys())[0]
-                style_manager.set_selected_style(first_style)
-            
-            resume_generator = ResumeGenerator()
-            resume_generator.set_resume_object(resume)
-            
-            driver = init_browser()
-            
             resume_facade = ResumeFacade(
                 api_key=self.api_key,
-                style_manager=style_manager,
-                resume_generator=resume_generator,
+                style_manager=self._ensure_style_manager(),
+                resume_generator=self._ensure_resume_generator(),
                 resume_object=resume,
                 output_path=Path("data_folder/output")
             )
             
-            resume_facade.set_driver(driver)
-            
             # Create job URL simulation for resume generation
             job_url = job_data.get('url', 'https://example.com/job')
             
@@ -271,23 +464,25 @@ class MAApplicationManager:
             </html>
             """
             
-            # Save temporary job page
-            temp_job_file = Path("data_folder/output/temp_job.html")
-            with open(temp_job_file, 'w') as f:
-                f.write(job_html)
-            
-            # Use file:// URL for local file
-            file_url = f"file://{temp_job_file.absolute()}"
-            resume_facade.link_to_job(file_url)
-            
-            # Generate tailored resume
-            resume_pdf, resume_filename = resume_facade.create_resume_pdf_job_tailored()
-            
-            # Generate cover letter
-            cover_letter_pdf, cover_letter_filename = resume_facade.create_cover_letter()
+            # Hand the page to the browser as an in-memory data: URL; no
+            # temp file round-trip through the output directory
+            data_url = "data:text/html;base64," + base64.b64encode(job_html.encode()).decode()
+
+            # The shared driver handles one job at a time
+            with self._driver_lock:
+                resume_facade.set_driver(self._ensure_driver())
+                resume_facade.link_to_job(data_url)
+                
+                # Generate tailored resume
+                resume_pdf, resume_filename = resume_facade.create_resume_pdf_job_tailored()
+                
+                # Generate cover letter
+                cover_letter_pdf, cover_letter_filename = resume_facade.create_cover_letter()
             
             # Save application record
-            job_id = f"{job_data.get('company', '').replace(' ', '_')}_{job_data.get('title', '').replace(' ', '_')}"
+            job_id = job_data.get('_job_key') or self._job_key(
+                job_data.get('company', ''), job_data.get('title', '')
+            )
             
             application_record = ApplicationRecord(
                 job_id=job_id,
@@ -300,10 +495,6 @@ class MAApplicationManager:
             
             self._save_application_record(application_record, job_data.get('url', ''))
             
-            # Clean up temporary files
-            if temp_job_file.exists():
-                temp_job_file.unlink()
-            
             return True
             
         except Exception as e:
@@ -311,16 +502,8 @@ class MAApplicationManager:
             return False
 
     def _save_application_record(self, record: ApplicationRecord, job_url: str):
-        """Save application record to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO applications 
-            (job_id, job_title, company, job_url, application_date, status, 
-             ma_relevance_score, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        """Stage an application record for the batched end-of-run insert"""
+        self._pending_records.append((
             record.job_id,
             record.job_title,
             record.company,
@@ -330,153 +513,191 @@ class MAApplicationManager:
             record.ma_relevance_score,
             record.notes
         ))
-        
-        conn.commit()
-        conn.close()
+
+    def _flush_application_records(self):
+        """Write all staged application rows in a single transaction"""
+        if not self._pending_records:
+            return
+
+        records, self._pending_records = self._pending_records, []
+        self._stats_cache = None
+        self._report_cache = None
+
+        # One fsync for the whole batch instead of one per application
+        with self._writer() as cursor:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO applications 
+                    (job_id, job_title, company, job_url, application_date, status, 
+                     ma_relevance_score, notes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', records)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
 
     def _send_follow_up_emails(self):
-        """Send follow-up emails for applications submitted 5-7 days ago"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        """Queue follow-up emails for applications submitted 5-7 days ago"""
+        if not self.email_config['email'] or not self.email_config['password']:
+            logger.warning("Email configuration not set, skipping follow-up emails")
+            return
+
         # Find applications from 5-7 days ago that haven't had follow-ups
         start_date = datetime.now() - timedelta(days=7)
         end_date = datetime.now() - timedelta(days=5)
-        
-        cursor.execute('''
-            SELECT job_id, job_title, company, application_date 
-            FROM applications 
-            WHERE application_date BETWEEN ? AND ? 
-            AND follow_up_sent = FALSE 
-            AND status = 'submitted'
-        ''', (start_date, end_date))
-        
-        applications = cursor.fetchall()
-        
-        for app in applications:
-            try:
-                self._send_follow_up_email(app[1], app[2])  # title, company
-                
-                # Mark follow-up as sent
-                cursor.execute(
-                    "UPDATE applications SET follow_up_sent = TRUE WHERE job_id = ?",
-                    (app[0],)
-                )
-                
-                logger.info(f"Sent follow-up email for {app[1]} at {app[2]}")
-                
-            except Exception as e:
-                logger.error(f"Error sending follow-up email for {app[1]}: {e}")
-        
-        conn.commit()
-        conn.close()
 
-    def _send_follow_up_email(self, job_title: str, company: str):
-        """Send a follow-up email for a specific application"""
-        if not self.email_config['email'] or not self.email_config['password']:
-            logger.warning("Email configuration not set, skipping follow-up email")
-            return
-        
-        subject = f"Following up on {job_title} application"
-        
-        body = f"""
-        Dear Hiring Manager,
+        with self._reader() as cursor:
+            cursor.execute('''
+                SELECT job_id, job_title, company 
+                FROM applications 
+                WHERE application_date BETWEEN ? AND ? 
+                AND follow_up_sent = FALSE 
+                AND status = 'submitted'
+            ''', (start_date, end_date))
 
-        I hope this email finds you well. I wanted to follow up on my recent application for the {job_title} position at {company}.
+            applications = cursor.fetchall()
 
-        I am very excited about the opportunity to contribute to your M&A team and would welcome the chance to discuss how my experience in financial modeling, due diligence, and deal execution can add value to your organization.
+        # The worker sends and marks follow_up_sent; the daily job no longer
+        # blocks on SMTP at all
+        for job_id, job_title, company in applications:
+            self._mail_queue.put((job_id, job_title, company))
 
-        I would be happy to provide any additional information you might need or to schedule a conversation at your convenience.
+    def _drain_mail_queue(self, timeout: float = MAIL_DRAIN_TIMEOUT):
+        """Wait until the mail worker has processed the queue, up to timeout"""
+        deadline = time.monotonic() + timeout
+        while self._mail_queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.5)
+        
+        remaining = self._mail_queue.unfinished_tasks
+        if remaining:
+            logger.warning(
+                f"{remaining} follow-up emails still queued after {timeout:.0f}s"
+            )
 
-        Thank you for your time and consideration.
+    def _open_smtp_session(self) -> smtplib.SMTP:
+        """Open and authenticate a single reusable SMTP session"""
+        server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
+        server.starttls()
+        server.login(self.email_config['email'], self.email_config['password'])
+        return server
 
-        Best regards,
-        [Your Name]
-        """
+    def _mail_worker_loop(self):
+        """Drain the mail queue, reusing one SMTP session per batch"""
+        server = None
+        while True:
+            try:
+                job_id, job_title, company = self._mail_queue.get(timeout=60)
+            except queue.Empty:
+                # Heartbeat so an idle session stays usable between batches
+                if server is not None:
+                    try:
+                        server.noop()
+                    except smtplib.SMTPException:
+                        server = None
+                continue
+
+            try:
+                if server is None:
+                    server = self._open_smtp_session()
+                try:
+                    self._send_follow_up_email(server, job_title, company)
+                except smtplib.SMTPServerDisconnected:
+                    server = self._open_smtp_session()
+                    self._send_follow_up_email(server, job_title, company)
+
+                # Mark follow-up as sent
+                with self._writer() as cursor:
+                    cursor.execute(
+                        "UPDATE applications SET follow_up_sent = TRUE WHERE job_id = ?",
+                        (job_id,)
+                    )
+
+                logger.info(f"Sent follow-up email for {job_title} at {company}")
+                time.sleep(1)  # space sends to stay under provider rate limits
+
+            except Exception as e:
+                logger.error(f"Error sending follow-up email for {job_title}: {e}")
+            finally:
+                self._mail_queue.task_done()
+
+    def _send_follow_up_email(self, server: smtplib.SMTP, job_title: str, company: str):
+        """Send a follow-up email for a specific application"""
+        msg = EmailMessage()
+        msg['From'] = self.email_config['email']
+        msg['To'] = "hr@example.com"  # This would need to be extracted from job posting
+        msg['Subject'] = _FOLLOW_UP_SUBJECT.format(title=job_title)
+        msg.set_content(_FOLLOW_UP_BODY.format(title=job_title, company=company))
         
-        try:
-            msg = MimeMultipart()
-            msg['From'] = self.email_config['email']
-            msg['To'] = "hr@example.com"  # This would need to be extracted from job posting
-            msg['Subject'] = subject
-            
-            msg.attach(MimeText(body, 'plain'))
-            
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['email'], self.email_config['password'])
-            
-            text = msg.as_string()
-            server.sendmail(self.email_config['email'], "hr@example.com", text)
-            server.quit()
-            
-        except Exception as e:
-            logger.error(f"Error sending follow-up email: {e}")
-            raise
+        server.send_message(msg)
 
     def _save_session_stats(self, stats: Dict):
         """Save job search session statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO job_search_sessions 
-            (session_date, jobs_found, applications_submitted, notes)
-            VALUES (?, ?, ?, ?)
-        ''', (
-            stats['date'],
-            stats['jobs_found'],
-            stats['applications_submitted'],
-            json.dumps(stats)
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._writer() as cursor:
+            cursor.execute('''
+                INSERT INTO job_search_sessions 
+                (session_date, jobs_found, applications_submitted, notes)
+                VALUES (?, ?, ?, ?)
+            ''', (
+                stats['date'],
+                stats['jobs_found'],
+                stats['applications_submitted'],
+                json.dumps(stats)
+            ))
 
     def get_application_statistics(self) -> Dict:
         """Get comprehensive application statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total applications
-        cursor.execute("SELECT COUNT(*) FROM applications")
-        total_applications = cursor.fetchone()[0]
-        
-        # Applications by status
-        cursor.execute("SELECT status, COUNT(*) FROM applications GROUP BY status")
-        status_counts = dict(cursor.fetchall())
-        
+        if (self._stats_cache is not None and
+                time.monotonic() - self._stats_cache[0] < self.STATS_CACHE_TTL):
+            return self._stats_cache[1]
+
+        week_ago = datetime.now() - timedelta(days=7)
+
+        with self._reader() as cursor:
+            # Status breakdown, total and recent count in one scan
+            cursor.execute("""
+                SELECT status, COUNT(*), 
+                       SUM(CASE WHEN application_date > ? THEN 1 ELSE 0 END) 
+                FROM applications 
+                GROUP BY status
+            """, (week_ago,))
+            status_rows = cursor.fetchall()
+
+            # Top companies applied to
+            cursor.execute("""
+                SELECT company, COUNT(*) as count 
+                FROM applications 
+                GROUP BY company 
+                ORDER BY count DESC 
+                LIMIT 10
+            """)
+            top_companies = cursor.fetchall()
+
+        status_counts = {status: count for status, count, _ in status_rows}
+        total_applications = sum(status_counts.values())
+        recent_applications = sum(recent or 0 for _, _, recent in status_rows)
+
         # Response rate
         responded = status_counts.get('responded', 0) + status_counts.get('interview', 0)
         response_rate = (responded / total_applications * 100) if total_applications > 0 else 0
         
-        # Recent activity (last 7 days)
-        week_ago = datetime.now() - timedelta(days=7)
-        cursor.execute("SELECT COUNT(*) FROM applications WHERE application_date > ?", (week_ago,))
-        recent_applications = cursor.fetchone()[0]
-        
-        # Top companies applied to
-        cursor.execute("""
-            SELECT company, COUNT(*) as count 
-            FROM applications 
-            GROUP BY company 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        top_companies = cursor.fetchall()
-        
-        conn.close()
-        
-        return {
+        stats = {
             'total_applications': total_applications,
             'status_breakdown': status_counts,
             'response_rate': round(response_rate, 2),
             'recent_applications': recent_applications,
             'top_companies': top_companies
         }
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
 
     def generate_daily_report(self) -> str:
         """Generate a daily activity report"""
+        if (self._report_cache is not None and
+                time.monotonic() - self._report_cache[0] < self.STATS_CACHE_TTL):
+            return self._report_cache[1]
+
         stats = self.get_application_statistics()
         
         report = f"""
@@ -501,4 +722,5 @@ class MAApplicationManager:
         for company, count in stats['top_companies'][:5]:
             report += f"• {company}: {count} applications\n        "
         
+        self._report_cache = (time.monotonic(), report)
         return report
\ No newline at end of file
@@ -3,23 +3,238 @@ M&A Job Application Dashboard
 Streamlit-based monitoring and analytics dashboard
 """
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sqlite3
+import io
 import json
 from pathlib import Path
+from typing import Dict, List
 
 from src.ma_application_manager import MAApplicationManager
 from src.logging import logger
 
+def _downsample(df: pd.DataFrame, max_points: int = 1000) -> pd.DataFrame:
+    """Thin a frame to at most max_points evenly spaced rows for plotting"""
+    if len(df) <= max_points:
+        return df
+    idx = np.linspace(0, len(df) - 1, max_points).round().astype(int)
+    return df.iloc[np.unique(idx)]
+
+@st.cache_resource(show_spinner=False)
+def _get_conn(db_path: str) -> sqlite3.Connection:
+    """One long-lived read-only connection shared by the data loaders"""
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro&cache=shared", uri=True, check_same_thread=False
+    )
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+# Data loaders live at module level so st.cache_data can hash their
+# arguments; bound methods would drag the dashboard instance into the key.
+# A 60s TTL keeps sidebar navigation on the in-memory cache instead of
+# re-querying SQLite on every rerun.
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_application_stats(db_path: str) -> Dict:
+    """Load application statistics from the database"""
+    conn = _get_conn(db_path)
+    
+    try:
+        # Scalar metrics in one aggregate row; building DataFrames just to
+        # read .iloc[0] costs more than the queries themselves
+        total_apps, avg_ma_score, recent_apps = conn.execute("""
+            SELECT COUNT(*), 
+                   AVG(ma_relevance_score), 
+                   SUM(CASE WHEN application_date > datetime('now', '-7 days') 
+                       THEN 1 ELSE 0 END) 
+            FROM applications
+        """).fetchone()
+        avg_ma_score = avg_ma_score or 0
+        recent_apps = recent_apps or 0
+        
+        # Status breakdown
+        status_breakdown = {
+            status: count
+            for status, count in conn.execute(
+                "SELECT status, COUNT(*) FROM applications GROUP BY status"
+            )
+        }
+        
+        # Response rate
+        responded = status_breakdown.get('responded', 0) + status_breakdown.get('interview', 0)
+        response_rate = (responded / total_apps * 100) if total_apps > 0 else 0
+        
+        return {
+            'total_applications': total_apps,
+            'status_breakdown': status_breakdown,
+            'response_rate': round(response_rate, 2),
+            'recent_applications': recent_apps,
+            'avg_ma_score': avg_ma_score,
+            'active_opportunities': status_breakdown.get('submitted', 0)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting application stats: {e}")
+        return {}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_application_timeline(db_path: str) -> pd.DataFrame:
+    """Load application timeline data"""
+    conn = _get_conn(db_path)
+    
+    try:
+        # Aggregate on the SQL side and let the loader parse dates directly
+        # into datetime64 — no second pass over the column in pandas
+        df = pd.read_sql_query("""
+            SELECT DATE(application_date) AS date, COUNT(*) AS applications
+            FROM applications
+            GROUP BY date
+            ORDER BY date
+        """, conn, parse_dates={'date': {'format': '%Y-%m-%d'}})
+        
+        return df
+        
+    except Exception as e:
+        logger.error(f"Error getting timeline data: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_recent_applications(db_path: str) -> pd.DataFrame:
+    """Load the most recent applications"""
+    conn = _get_conn(db_path)
+    
+    try:
+        # Ten rows don't justify read_sql_query's machinery; fetch them with
+        # a plain cursor and build the frame directly
+        rows = conn.execute("""
+            SELECT job_title, company, status, application_date, ma_relevance_score
+            FROM applications
+            ORDER BY application_date DESC
+            LIMIT 10
+        """).fetchall()
+        
+        return pd.DataFrame.from_records(
+            rows,
+            columns=['job_title', 'company', 'status', 'application_date',
+                     'ma_relevance_score']
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting recent applications: {e}")
+        return pd.DataFrame()
+
+# The distinct-company list changes at most a few times a day; a longer
+# TTL keeps the filter dropdown off the database entirely
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_companies(db_path: str) -> List[str]:
+    """Load the list of companies applied to"""
+    conn = _get_conn(db_path)
+    
+    try:
+        df = pd.read_sql_query(
+            "SELECT DISTINCT company FROM applications ORDER BY company", conn
+        )
+        return df['company'].tolist()
+        
+    except Exception as e:
+        logger.error(f"Error getting companies: {e}")
+        return []
+
+def _applications_query(status_filter: str, company_filter: str,
+                        date_range: tuple) -> tuple:
+    """Build the filtered applications query and its parameters"""
+    query = "SELECT * FROM applications WHERE 1=1"
+    params = []
+    
+    if status_filter != "All":
+        query += " AND status = ?"
+        params.append(status_filter)
+    
+    if company_filter != "All":
+        query += " AND company = ?"
+        params.append(company_filter)
+    
+    if len(date_range) == 2:
+        query += " AND DATE(application_date) BETWEEN ? AND ?"
+        params.extend([date_range[0].strftime('%Y-%m-%d'), date_range[1].strftime('%Y-%m-%d')])
+    
+    query += " ORDER BY application_date DESC"
+    return query, params
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_applications(db_path: str, status_filter: str, company_filter: str,
+                       date_range: tuple, page: int = 1,
+                       page_size: int = 100) -> pd.DataFrame:
+    """Load one page of applications matching the selected filters"""
+    conn = _get_conn(db_path)
+    
+    try:
+        query, params = _applications_query(status_filter, company_filter, date_range)
+        query += " LIMIT ? OFFSET ?"
+        params.extend([page_size, (page - 1) * page_size])
+        
+        df = pd.read_sql_query(query, conn, params=params)
+        return df
+        
+    except Exception as e:
+        logger.error(f"Error getting applications: {e}")
+        return pd.DataFrame()
+
+def _export_applications_csv(db_path: str, status_filter: str, company_filter: str,
+                             date_range: tuple) -> bytes:
+    """Stream the full filtered history into CSV, 10k rows at a time"""
+    conn = _get_conn(db_path)
+    query, params = _applications_query(status_filter, company_filter, date_range)
+    
+    buf = io.StringIO()
+    header = True
+    for chunk in pd.read_sql_query(query, conn, params=params, chunksize=10000):
+        chunk.to_csv(buf, header=header, index=False)
+        header = False
+    
+    return buf.getvalue().encode()
+
 class MADashboard:
     """Interactive dashboard for M&A job application monitoring"""
     
     def __init__(self, config: Dict):
         self.config = config
         self.db_path = Path("data_folder/output/ma_applications.db")
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Index the columns the dashboard filters and sorts on"""
+        if not self.db_path.exists():
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            # WAL lets the dashboard read while the applier writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_app_date ON applications(application_date)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_status ON applications(status)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_company ON applications(company)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_status_date "
+                "ON applications(status, application_date DESC)"
+            )
+        except Exception as e:
+            logger.error(f"Error creating dashboard indexes: {e}")
+        finally:
+            conn.close()
         
     def run_dashboard(self):
         """Run the Streamlit dashboard"""
@@ -104,12 +319,16 @@ class MADashboard:
             # Applications over time
             timeline_data = self.get_application_timeline()
             if not timeline_data.empty:
+                # Cap the points sent to the browser; months of history would
+                # otherwise make the SVG renderer crawl
                 fig = px.line(
-                    timeline_data,
+                    _downsample(timeline_data),
                     x='date',
                     y='applications',
-                    title="Applications Over Time"
+                    title="Applications Over Time",
+                    render_mode='webgl'
                 )
+                fig.update_layout(uirevision='constant')
                 st.plotly_chart(fig, use_container_width=True)
         
         # Recent activity
@@ -146,8 +365,13 @@ class MADashboard:
                 max_value=datetime.now()
             )
         
-        # Get filtered applications
-        applications = self.get_applications(status_filter, company_filter, date_range)
+        # Paginate so a long history never materializes in one frame
+        page = st.number_input("Page", min_value=1, value=1, step=1)
+        
+        # Get the current page of filtered applications
+        applications = self.get_applications(
+            status_filter, company_filter, date_range, page=int(page)
+        )
         
         if not applications.empty:
             # Add action buttons
@@ -159,10 +383,13 @@ class MADashboard:
             
             with col2:
                 if st.button("📊 Export Data"):
-                    csv = applications.to_csv(index=False)
+                    csv_bytes = _export_applications_csv(
+                        str(self.db_path), status_filter, company_filter,
+                        tuple(date_range)
+                    )
                     st.download_button(
                         "Download CSV",
-                        csv,
+                        csv_bytes,
                         "ma_applications.csv",
                         "text/csv"
                     )
@@ -253,8 +480,11 @@ class MADashboard:
                     response_trends,
                     x='week',
                     y='response_rate',
-                    title="Weekly Response Rate"
+                    title="Weekly Response Rate",
+                    render_mode='webgl'
                 )
+                # Keep zoom/pan state so Plotly skips full layout recompute
+                fig.update_layout(uirevision='constant')
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -262,17 +492,19 @@ class MADashboard:
             score_response = self.get_score_response_correlation()
             if not score_response.empty:
                 fig = px.scatter(
-                    score_response,
+                    _downsample(score_response, max_points=2000),
                     x='ma_relevance_score',
                     y='got_response',
                     title="M&A Score vs Response Correlation",
-                    trendline="ols"
+                    trendline="ols",
+                    render_mode='webgl'
                 )
+                fig.update_layout(uirevision='constant')
                 st.plotly_chart(fig, use_container_width=True)
         
-        # Performance insights
+        # Performance insights, reusing the cached stats from page entry
         st.subheader("🎯 Performance Insights")
-        insights = self.generate_insights()
+        insights = self.generate_insights(self.get_application_stats())
         for insight in insights:
             st.info(insight)
 
@@ -353,156 +585,38 @@ class MADashboard:
         """Get application statistics from database"""
         if not self.db_path.exists():
             return {}
-        
-        conn = sqlite3.connect(self.db_path)
-        
-        try:
-            # Total applications
-            total_apps = pd.read_sql_query(
-                "SELECT COUNT(*) as count FROM applications", conn
-            ).iloc[0]['count']
-            
-            # Status breakdown
-            status_df = pd.read_sql_query(
-                "SELECT status, COUNT(*) as count FROM applications GROUP BY status", conn
-            )
-            status_breakdown = dict(zip(status_df['status'], status_df['count']))
-            
-            # Response rate
-            responded = status_breakdown.get('responded', 0) + status_breakdown.get('interview', 0)
-            response_rate = (responded / total_apps * 100) if total_apps > 0 else 0
-            
-            # Recent applications (last 7 days)
-            recent_df = pd.read_sql_query(
-                "SELECT COUNT(*) as count FROM applications WHERE application_date > datetime('now', '-7 days')", conn
-            )
-            recent_apps = recent_df.iloc[0]['count']
-            
-            # Average M&A score
-            avg_score_df = pd.read_sql_query(
-                "SELECT AVG(ma_relevance_score) as avg_score FROM applications", conn
-            )
-            avg_ma_score = avg_score_df.iloc[0]['avg_score'] or 0
-            
-            return {
-                'total_applications': total_apps,
-                'status_breakdown': status_breakdown,
-                'response_rate': round(response_rate, 2),
-                'recent_applications': recent_apps,
-                'avg_ma_score': avg_ma_score,
-                'active_opportunities': status_breakdown.get('submitted', 0)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting application stats: {e}")
-            return {}
-        finally:
-            conn.close()
+        return _load_application_stats(str(self.db_path))
 
     def get_application_timeline(self) -> pd.DataFrame:
         """Get application timeline data"""
         if not self.db_path.exists():
             return pd.DataFrame()
-        
-        conn = sqlite3.connect(self.db_path)
-        
-        try:
-            df = pd.read_sql_query("""
-                SELECT DATE(application_date) as date, COUNT(*) as applications
-                FROM applications
-                GROUP BY DATE(application_date)
-                ORDER BY date
-            """, conn)
-            
-            df['date'] = pd.to_datetime(df['date'])
-            return df
-            
-        except Exception as e:
-            logger.error(f"Error getting timeline data: {e}")
-            return pd.DataFrame()
-        finally:
-            conn.close()
+        return _load_application_timeline(str(self.db_path))
 
     def get_recent_applications(self) -> pd.DataFrame:
         """Get recent applications"""
         if not self.db_path.exists():
             return pd.DataFrame()
-        
-        conn = sqlite3.connect(self.db_path)
-        
-        try:
-            df = pd.read_sql_query("""
-                SELECT job_title, company, status, application_date, ma_relevance_score
-                FROM applications
-                ORDER BY application_date DESC
-                LIMIT 10
-            """, conn)
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Error getting recent applications: {e}")
-            return pd.DataFrame()
-        finally:
-            conn.close()
+        return _load_recent_applications(str(self.db_path))
 
     def get_companies(self) -> List[str]:
         """Get list of companies applied to"""
         if not self.db_path.exists():
             return []
-        
-        conn = sqlite3.connect(self.db_path)
-        
-        try:
-            df = pd.read_sql_query(
-                "SELECT DISTINCT company FROM applications ORDER BY company", conn
-            )
-            return df['company'].tolist()
-            
-        except Exception as e:
-            logger.error(f"Error getting companies: {e}")
-            return []
-        finally:
-            conn.close()
+        return _load_companies(str(self.db_path))
 
-    def get_applications(self, status_filter: str, company_filter: str, date_range) -> pd.DataFrame:
-        """Get filtered applications"""
+    def get_applications(self, status_filter: str, company_filter: str, date_range,
+                         page: int = 1) -> pd.DataFrame:
+        """Get one page of filtered applications"""
         if not self.db_path.exists():
             return pd.DataFrame()
-        
-        conn = sqlite3.connect(self.db_path)
-        
-        try:
-            query = "SELECT * FROM applications WHERE 1=1"
-            params = []
-            
-            if status_filter != "All":
-                query += " AND status = ?"
-                params.append(status_filter)
-            
-            if company_filter != "All":
-                query += " AND company = ?"
-                params.append(company_filter)
-            
-            if len(date_range) == 2:
-                query += " AND DATE(application_date) BETWEEN ? AND ?"
-                params.extend([date_range[0].strftime('%Y-%m-%d'), date_range[1].strftime('%Y-%m-%d')])
-            
-            query += " ORDER BY application_date DESC"
-            
-            df = pd.read_sql_query(query, conn, params=params)
-            return df
-            
-        except Exception as e:
-            logger.error(f"Error getting applications: {e}")
-            return pd.DataFrame()
-        finally:
-            conn.close()
+        return _load_applications(
+            str(self.db_path), status_filter, company_filter, tuple(date_range), page
+        )
 
-    def generate_insights(self) -> List[str]:
-        """Generate performance insights"""
+    def generate_insights(self, stats: Dict) -> List[str]:
+        """Generate performance insights from already-loaded statistics"""
         insights = []
-        stats = self.get_application_stats()
         
         if stats.get('response_rate', 0) > 15:
             insights.append("🎉 Excellent response rate! Your applications are well-targeted.")
@@ -2,7 +2,14 @@
 M&A Job Filter Module
 Specialized filtering and prioritization for Mergers & Acquisitions job opportunities
 """
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
 from typing import List, Dict, Set
 from dataclasses import dataclass
 from src.logging import logger
@@ -17,48 +24,136 @@ class MAJobCriteria:
     salary_range: tuple
     experience_levels: Set[str]
 
+# One filter per worker process, built lazily on first use so the pool
+# pays the construction cost once instead of pickling state per task
+_worker_filter = None
+
+def _enrich_one(args: tuple) -> tuple:
+    """Worker-side enrichment: target-company flag and salary range"""
+    global _worker_filter
+    if _worker_filter is None:
+        _worker_filter = MAJobFilter()
+    company_lower, description_lower = args
+    return (
+        _worker_filter._is_target_company_lower(company_lower),
+        _worker_filter._extract_salary_range_lower(description_lower),
+    )
+
 class MAJobFilter:
     """Advanced filtering system for M&A job opportunities"""
     
+    # Below this many surviving jobs the pool start-up costs more than it saves
+    PARALLEL_ENRICH_THRESHOLD = 2000
+    
+    # Immutable keyword data shared by every instance: frozensets of interned
+    # strings, built once at class creation
+    ma_keywords = {
+        'primary': frozenset(map(sys.intern, (
+            'mergers', 'acquisitions', 'm&a', 'merger', 'acquisition',
+            'investment banking', 'corporate finance', 'private equity',
+            'deal', 'transaction', 'due diligence', 'valuation'
+        ))),
+        'secondary': frozenset(map(sys.intern, (
+            'lbo', 'leveraged buyout', 'dcf', 'financial modeling',
+            'pitch book', 'synergy', 'integration', 'divestiture',
+            'restructuring', 'capital markets', 'equity research'
+        ))),
+        'skills': frozenset(map(sys.intern, (
+            'excel', 'bloomberg', 'powerpoint', 'financial analysis',
+            'modeling', 'cfa', 'mba', 'accounting', 'finance'
+        )))
+    }
+    
+    target_companies = {
+        'bulge_bracket': frozenset(map(sys.intern, (
+            'goldman sachs', 'jpmorgan', 'morgan stanley', 'bank of america',
+            'citigroup', 'barclays', 'credit suisse', 'deutsche bank'
+        ))),
+        'boutique': frozenset(map(sys.intern, (
+            'evercore', 'moelis', 'lazard', 'centerview', 'perella weinberg',
+            'greenhill', 'rothschild', 'pjt partners', 'guggenheim'
+        ))),
+        'consulting': frozenset(map(sys.intern, (
+            'mckinsey', 'bain', 'bcg', 'deloitte', 'pwc', 'ey', 'kpmg'
+        ))),
+        'private_equity': frozenset(map(sys.intern, (
+            'blackstone', 'kkr', 'carlyle', 'apollo', 'tpg', 'warburg pincus'
+        )))
+    }
+    
     def __init__(self):
-        self.ma_keywords = {
-            'primary': {
-                'mergers', 'acquisitions', 'm&a', 'merger', 'acquisition',
-                'investment banking', 'corporate finance', 'private equity',
-                'deal', 'transaction', 'due diligence', 'valuation'
-            },
-            'secondary': {
-                'lbo', 'leveraged buyout', 'dcf', 'financial modeling',
-                'pitch book', 'synergy', 'integration', 'divestiture',
-                'restructuring', 'capital markets', 'equity research'
-            },
-            'skills': {
-                'excel', 'bloomberg', 'powerpoint', 'financial analysis',
-                'modeling', 'cfa', 'mba', 'accounting', 'finance'
-            }
-        }
+        # Flat membership set so target-company checks skip the category walk
+        self._all_target_companies = frozenset().union(*self.target_companies.values())
+        
+        # Single alternation over every target company: one C-level scan per
+        # check instead of one substring search per name
+        self._company_pattern = re.compile(
+            '|'.join(
+                re.escape(c)
+                for c in sorted(self._all_target_companies, key=len, reverse=True)
+            )
+        )
         
-        self.target_companies = {
-            'bulge_bracket': {
-                'goldman sachs', 'jpmorgan', 'morgan stanley', 'bank of america',
-                'citigroup', 'barclays', 'credit suisse', 'deutsche bank'
-            },
-            'boutique': {
-                'evercore', 'moelis', 'lazard', 'centerview', 'perella weinberg',
-                'greenhill', 'rothschild', 'pjt partners', 'guggenheim'
-            },
-            'consulting': {
-                'mckinsey', 'bain', 'bcg', 'deloitte', 'pwc', 'ey', 'kpmg'
-            },
-            'private_equity': {
-                'blackstone', 'kkr', 'carlyle', 'apollo', 'tpg', 'warburg pincus'
-            }
+        # One compiled alternation per keyword tier: a single scan of the
+        # text replaces ~30 separate substring checks. Longest-first ordering
+        # makes overlapping keywords ('mergers' vs 'merger') match whole.
+        self._keyword_patterns = {
+            category: re.compile(
+                '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+            )
+            for category, keywords in self.ma_keywords.items()
         }
         
+        # Salary patterns compiled once, each paired with the factor its
+        # captured numbers must be scaled by (the 'k' forms)
+        self._salary_patterns = [
+            (re.compile(r'\$(\d{1,3}(?:,\d{3})*)\s*-\s*\$(\d{1,3}(?:,\d{3})*)'), 1),
+            (re.compile(r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*k'), 1000),
+            (re.compile(r'\$(\d{1,3})k\s*-\s*\$(\d{1,3})k'), 1000),
+        ]
+        
         self.geographic_targets = {
             'primary': ['new york', 'manhattan', 'nyc', 'rockville centre'],
             'secondary': ['long island', 'brooklyn', 'queens', 'jersey city', 'stamford']
         }
+        
+        # Pre-lowered tuples for the location boosts; priority_score tests
+        # these per job and shouldn't rebuild or re-lower anything
+        self._primary_geos = tuple(t.lower() for t in self.geographic_targets['primary'])
+        self._secondary_geos = tuple(t.lower() for t in self.geographic_targets['secondary'])
+        self._primary_geo_pattern = re.compile(
+            '|'.join(re.escape(t) for t in self._primary_geos)
+        )
+        self._secondary_geo_pattern = re.compile(
+            '|'.join(re.escape(t) for t in self._secondary_geos)
+        )
+
+    def score_batch(self, descriptions, titles) -> np.ndarray:
+        """Score many jobs at once; counts and caps stay vectorized throughout"""
+        desc_lower = pd.Series(descriptions).fillna('').str.lower()
+        title_lower = pd.Series(titles).fillna('').str.lower()
+        return self._score_batch_lower(desc_lower, title_lower)
+
+    @staticmethod
+    def _distinct_counts(lowered: pd.Series, pattern: re.Pattern) -> np.ndarray:
+        """Distinct keywords matched per row for one tier's alternation"""
+        # Same semantics as the scalar len(set(findall(...))): a keyword
+        # repeated ten times still counts once
+        return lowered.str.findall(pattern).map(lambda m: len(set(m))).to_numpy(np.int32)
+
+    def _score_batch_lower(self, desc_lower: pd.Series, title_lower: pd.Series) -> np.ndarray:
+        """Batch scoring over already-lowered text columns"""
+        title_hits = self._distinct_counts(title_lower, self._keyword_patterns['primary'])
+        primary_hits = self._distinct_counts(desc_lower, self._keyword_patterns['primary'])
+        secondary_hits = self._distinct_counts(desc_lower, self._keyword_patterns['secondary'])
+        skills_hits = self._distinct_counts(desc_lower, self._keyword_patterns['skills'])
+        
+        return (
+            np.minimum(title_hits * 10, 40)
+            + np.minimum(primary_hits * 5, 30)
+            + np.minimum(secondary_hits * 3, 20)
+            + np.minimum(skills_hits * 2, 10)
+        ).astype(float)
 
     def calculate_ma_relevance_score(self, job_description: str, job_title: str) -> float:
         """Calculate relevance score for M&A positions (0-100)"""
@@ -67,25 +162,22 @@ class MAJobFilter:
         title_lower = job_title.lower()
         
         # Title scoring (40% weight)
-        title_score = 0
-        for keyword in self.ma_keywords['primary']:
-            if keyword in title_lower:
-                title_score += 10
-        title_score = min(title_score, 40)
+        title_matches = set(self._keyword_patterns['primary'].findall(title_lower))
+        title_score = min(len(title_matches) * 10, 40)
         
         # Description scoring (60% weight)
         desc_score = 0
         
         # Primary keywords (30 points max)
-        primary_matches = sum(1 for kw in self.ma_keywords['primary'] if kw in description_lower)
+        primary_matches = len(set(self._keyword_patterns['primary'].findall(description_lower)))
         desc_score += min(primary_matches * 5, 30)
         
         # Secondary keywords (20 points max)
-        secondary_matches = sum(1 for kw in self.ma_keywords['secondary'] if kw in description_lower)
+        secondary_matches = len(set(self._keyword_patterns['secondary'].findall(description_lower)))
         desc_score += min(secondary_matches * 3, 20)
         
         # Skills keywords (10 points max)
-        skills_matches = sum(1 for kw in self.ma_keywords['skills'] if kw in description_lower)
+        skills_matches = len(set(self._keyword_patterns['skills'].findall(description_lower)))
         desc_score += min(skills_matches * 2, 10)
         
         total_score = title_score + desc_score
@@ -94,32 +186,27 @@ class MAJobFilter:
 
     def is_target_company(self, company_name: str) -> bool:
         """Check if company is a target M&A employer"""
-        company_lower = company_name.lower()
-        
-        for category, companies in self.target_companies.items():
-            for target_company in companies:
-                if target_company in company_lower:
-                    logger.debug(f"Found target company: {company_name} ({category})")
-                    return True
+        return self._is_target_company_lower(company_name.lower())
+
+    def _is_target_company_lower(self, company_lower: str) -> bool:
+        """Target-company check over an already-lowered name"""
+        if self._company_pattern.search(company_lower):
+            logger.debug(f"Found target company: {company_lower}")
+            return True
         return False
 
     def extract_salary_range(self, job_description: str) -> tuple:
         """Extract salary information from job description"""
-        salary_patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*)\s*-\s*\$(\d{1,3}(?:,\d{3})*)',
-            r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*k',
-            r'\$(\d{1,3})k\s*-\s*\$(\d{1,3})k'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE)
+        return self._extract_salary_range_lower(job_description.lower())
+
+    def _extract_salary_range_lower(self, description_lower: str) -> tuple:
+        """Salary extraction over an already-lowered description"""
+        for pattern, multiplier in self._salary_patterns:
+            match = pattern.search(description_lower)
             if match:
                 try:
-                    low = int(match.group(1).replace(',', ''))
-                    high = int(match.group(2).replace(',', ''))
-                    if 'k' in pattern:
-                        low *= 1000
-                        high *= 1000
+                    low = int(match.group(1).replace(',', '')) * multiplier
+                    high = int(match.group(2).replace(',', '')) * multiplier
                     return (low, high)
                 except ValueError:
                     continue
@@ -128,62 +215,82 @@ class MAJobFilter:
 
     def filter_ma_jobs(self, jobs: List[Dict], min_score: float = 60.0) -> List[Dict]:
         """Filter and rank jobs based on M&A relevance"""
-        filtered_jobs = []
-        
-        for job in jobs:
-            try:
-                # Calculate M&A relevance score
-                score = self.calculate_ma_relevance_score(
-                    job.get('description', ''),
-                    job.get('title', '')
-                )
-                
-                # Check if meets minimum score threshold
-                if score >= min_score:
-                    job['ma_score'] = score
-                    job['is_target_company'] = self.is_target_company(job.get('company', ''))
-                    job['salary_range'] = self.extract_salary_range(job.get('description', ''))
-                    filtered_jobs.append(job)
-                    
-            except Exception as e:
-                logger.error(f"Error filtering job {job.get('title', 'Unknown')}: {e}")
-                continue
-        
-        # Sort by M&A relevance score (descending)
-        filtered_jobs.sort(key=lambda x: x['ma_score'], reverse=True)
+        if not jobs:
+            logger.info("Filtered 0 M&A-relevant jobs from 0 total jobs")
+            return []
+        
+        # Score the whole batch column-wise; pandas runs one C regex pass
+        # per keyword tier instead of a Python loop over every job
+        df = pd.DataFrame(jobs)
+        for col in ('title', 'description'):
+            if col not in df:
+                df[col] = ''
+        
+        title_lower = df['title'].fillna('').str.lower()
+        desc_lower = df['description'].fillna('').str.lower()
+        
+        df['ma_score'] = self._score_batch_lower(desc_lower, title_lower)
+        
+        kept = df[df['ma_score'] >= min_score].sort_values('ma_score', ascending=False)
+        filtered_jobs = kept.to_dict('records')
+        
+        # Company and salary enrichment only for the survivors, reusing the
+        # descriptions already lowered for the scoring pass; large batches
+        # fan the pure-Python string work out across processes
+        enrich_args = [
+            (job.get('company', '').lower(), lowered_desc)
+            for job, lowered_desc in zip(filtered_jobs, desc_lower.loc[kept.index])
+        ]
+        
+        if len(enrich_args) >= self.PARALLEL_ENRICH_THRESHOLD:
+            chunksize = max(1, len(enrich_args) // (4 * (os.cpu_count() or 1)))
+            with ProcessPoolExecutor() as executor:
+                enriched = list(executor.map(_enrich_one, enrich_args, chunksize=chunksize))
+        else:
+            enriched = [_enrich_one(args) for args in enrich_args]
+        
+        for job, (is_target, salary_range) in zip(filtered_jobs, enriched):
+            job['is_target_company'] = is_target
+            job['salary_range'] = salary_range
         
         logger.info(f"Filtered {len(filtered_jobs)} M&A-relevant jobs from {len(jobs)} total jobs")
         return filtered_jobs
 
     def prioritize_applications(self, jobs: List[Dict]) -> List[Dict]:
         """Prioritize job applications based on multiple factors"""
-        def priority_score(job):
-            score = job.get('ma_score', 0)
-            
-            # Boost for target companies
-            if job.get('is_target_company', False):
-                score += 20
-            
-            # Boost for salary range alignment
-            salary_range = job.get('salary_range', (0, 0))
-            if salary_range[0] >= 120000:  # Target salary threshold
-                score += 15
-            
-            # Boost for location preference
-            location = job.get('location', '').lower()
-            if any(target in location for target in self.geographic_targets['primary']):
-                score += 10
-            elif any(target in location for target in self.geographic_targets['secondary']):
-                score += 5
-            
-            return score
-        
-        prioritized_jobs = sorted(jobs, key=priority_score, reverse=True)
-        
-        # Add priority rank to each job
-        for i, job in enumerate(prioritized_jobs):
-            job['priority_rank'] = i + 1
-            job['priority_score'] = priority_score(job)
+        if not jobs:
+            logger.info("Prioritized 0 M&A jobs for application")
+            return []
+        
+        # Column-wise pipeline: every boost is one vectorized expression over
+        # the batch instead of per-job dict reads and writes
+        df = pd.DataFrame(jobs)
+        if 'ma_score' not in df:
+            df['ma_score'] = 0.0
+        if 'is_target_company' not in df:
+            df['is_target_company'] = False
+        if 'salary_range' not in df:
+            df['salary_range'] = [(0, 0)] * len(df)
+        if 'location' not in df:
+            df['location'] = ''
+        
+        salary_low = df['salary_range'].map(lambda r: r[0] if r else 0)
+        location_lower = df['location'].fillna('').str.lower()
+        in_primary = location_lower.str.contains(self._primary_geo_pattern)
+        in_secondary = location_lower.str.contains(self._secondary_geo_pattern)
+        
+        df['priority_score'] = (
+            df['ma_score'].fillna(0)
+            + 20 * df['is_target_company'].astype(bool).astype(int)
+            + 15 * (salary_low >= 120000).astype(int)  # Target salary threshold
+            + np.where(in_primary, 10, np.where(in_secondary, 5, 0))
+        )
+        
+        df = df.sort_values('priority_score', ascending=False, kind='stable')
+        df = df.reset_index(drop=True)
+        df['priority_rank'] = df.index + 1
+        
+        prioritized_jobs = df.to_dict('records')
         
         logger.info(f"Prioritized {len(prioritized_jobs)} M&A jobs for application")
         return prioritized_jobs
\ No newline at end of file
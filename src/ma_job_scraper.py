@@ -2,21 +2,41 @@
 M&A Job Scraper Module
 Specialized web scraping and API integration for M&A job opportunities
 """
+import asyncio
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
 import requests
-import time
+from requests.adapters import HTTPAdapter, Retry
 import json
 from typing import List, Dict, Optional, Set
+from urllib.parse import urlsplit
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from src.logging import logger
 from src.utils.chrome_utils import init_browser
 
+# Faster event loop for the async fetch paths when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Only the subtrees the Indeed parsers actually read get materialized
+_JOB_CARD_STRAINER = SoupStrainer('div', class_='job_seen_beacon')
+_DESCRIPTION_STRAINER = SoupStrainer('div', class_='jobsearch-jobDescriptionText')
+_GLASSDOOR_CARD_STRAINER = SoupStrainer(attrs={'data-test': 'job-listing'})
+
 @dataclass
 class MAJobListing:
     """Data structure for M&A job listings"""
@@ -39,7 +59,29 @@ class MAJobScraper:
         self.config = config
         self.target_location = "Rockville Centre, NY"
         self.search_radius = 25  # miles
-        self.driver = None
+        self._driver_pool: Optional[queue.Queue] = None
+        
+        # One pooled session for all synchronous HTTP; fresh requests.get
+        # calls pay a TCP+TLS handshake per URL
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.http.mount('https://', adapter)
+        self.http.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        
+        # The same posting surfaces under several keywords; cache fetched
+        # descriptions by URL and computed scores by job identity
+        self._description_cache: Dict[str, str] = {}
+        # (title, company) keys already scraped this run, checked before any
+        # description fetch so duplicates across sources cost nothing;
+        # cleared at the start of every get_all_ma_jobs run
+        self._seen_keys: set = set()
+        self._relevance_cache: Dict[tuple, float] = {}
         
         # M&A-specific search terms
         self.ma_keywords = [
@@ -49,6 +91,16 @@ class MAJobScraper:
             "Corporate Development", "Leveraged Buyout", "LBO"
         ]
         
+        # M&A scoring keywords, by field
+        self.ma_title_keywords = [
+            'm&a', 'merger', 'acquisition', 'investment banking',
+            'corporate finance', 'private equity'
+        ]
+        self.ma_desc_keywords = [
+            'due diligence', 'financial modeling', 'valuation', 'dcf', 'lbo',
+            'leveraged buyout', 'deal', 'transaction', 'synergy', 'integration'
+        ]
+        
         # Target companies in M&A space
         self.target_companies = {
             'bulge_bracket': [
@@ -69,223 +121,440 @@ class MAJobScraper:
             ]
         }
 
-    def initialize_driver(self):
-        """Initialize Selenium WebDriver"""
-        if not self.driver:
-            self.driver = init_browser()
-            logger.info("Selenium WebDriver initialized for M&A job scraping")
+        # Per-field alternations compiled once; relevance scoring then does a
+        # single scan of each text instead of one pass per keyword
+        self._title_pattern = re.compile(
+            '|'.join(re.escape(k) for k in sorted(self.ma_title_keywords, key=len, reverse=True))
+        )
+        self._desc_pattern = re.compile(
+            '|'.join(re.escape(k) for k in sorted(self.ma_desc_keywords, key=len, reverse=True))
+        )
+        self._target_companies_lower = tuple(
+            company.lower()
+            for companies in self.target_companies.values()
+            for company in companies
+        )
+        self._company_pattern = re.compile(
+            '|'.join(
+                re.escape(c)
+                for c in sorted(self._target_companies_lower, key=len, reverse=True)
+            )
+        )
+
+    # Concurrent Selenium sessions for the keyword scrapes
+    DRIVER_POOL_SIZE = 3
+
+    # Static assets the scrapers never read; blocking them cuts page weight
+    # and lets waits resolve sooner
+    BLOCKED_URL_PATTERNS = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+        '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm'
+    ]
+
+    def _ensure_driver_pool(self) -> queue.Queue:
+        """Start the WebDriver pool on first Selenium use"""
+        if self._driver_pool is None:
+            pool = queue.Queue()
+            for _ in range(self.DRIVER_POOL_SIZE):
+                pool.put(self._configure_scraping_driver(init_browser()))
+            self._driver_pool = pool
+            logger.info(f"Started {self.DRIVER_POOL_SIZE} pooled WebDrivers for M&A job scraping")
+        return self._driver_pool
+
+    @classmethod
+    def _configure_scraping_driver(cls, driver):
+        """Block images, fonts and media on a scraping driver"""
+        # Applied per pooled driver rather than in init_browser, which the
+        # application flow also uses for rendered pages and PDF export
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': cls.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not enable request blocking on scraping driver: {e}")
+        return driver
+
+    def _scrape_keywords_pooled(self, scrape_keyword, keywords: List[str]) -> List:
+        """Run a per-keyword scrape function across the driver pool"""
+        pool = self._ensure_driver_pool()
+        
+        def run_one(keyword):
+            driver = pool.get()
+            try:
+                return scrape_keyword(driver, keyword)
+            finally:
+                pool.put(driver)
+        
+        jobs = []
+        with ThreadPoolExecutor(max_workers=self.DRIVER_POOL_SIZE) as executor:
+            for keyword_jobs in executor.map(run_one, keywords):
+                jobs.extend(keyword_jobs)
+        return jobs
 
     def scrape_linkedin_jobs(self, keywords: List[str], location: str) -> List[MAJobListing]:
         """Scrape M&A jobs from LinkedIn"""
         jobs = []
-        self.initialize_driver()
         
         try:
-            for keyword in keywords:
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&location={location}&distance=25"
-                self.driver.get(search_url)
-                time.sleep(3)
-                
-                # Scroll to load more jobs
-                for _ in range(3):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                
-                # Extract job listings
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
-                
-                for card in job_cards[:20]:  # Limit to first 20 results per keyword
-                    try:
-                        title = card.find_element(By.CSS_SELECTOR, ".base-search-card__title").text
-                        company = card.find_element(By.CSS_SELECTOR, ".base-search-card__subtitle").text
-                        location_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
-                        job_location = location_elem.text if location_elem else ""
-                        
-                        # Get job URL
-                        link_elem = card.find_element(By.CSS_SELECTOR, ".base-card__full-link")
-                        job_url = link_elem.get_attribute("href")
-                        
-                        # Get job description (requires clicking into job)
-                        description = self._get_linkedin_job_description(job_url)
-                        
-                        # Calculate M&A relevance score
-                        relevance_score = self._calculate_ma_relevance(title, description, company)
-                        
-                        if relevance_score >= 60:  # Only include relevant M&A jobs
-                            job = MAJobListing(
-                                title=title,
-                                company=company,
-                                location=job_location,
-                                description=description,
-                                url=job_url,
-                                salary_range=None,
-                                posted_date=None,
-                                job_type="Full-time",
-                                experience_level="Mid-Senior",
-                                source="LinkedIn",
-                                ma_relevance_score=relevance_score
-                            )
-                            jobs.append(job)
-                            
-                    except Exception as e:
-                        logger.warning(f"Error extracting LinkedIn job: {e}")
-                        continue
+            # Two phases: collect card metadata per keyword, then fetch every
+            # description across the pool so the page loads overlap instead of
+            # running one at a time inside each card loop
+            cards = self._scrape_keywords_pooled(
+                lambda driver, keyword: self._scrape_linkedin_keyword(driver, keyword, location),
+                keywords
+            )
+            descriptions = self._fetch_linkedin_descriptions([card[3] for card in cards])
+            
+            for title, company, job_location, job_url in cards:
+                description = descriptions.get(job_url, "")
                 
-                time.sleep(2)  # Rate limiting
+                # Calculate M&A relevance score
+                relevance_score = self._calculate_ma_relevance(title, description, company)
                 
+                if relevance_score >= 60:  # Only include relevant M&A jobs
+                    job = MAJobListing(
+                        title=title,
+                        company=company,
+                        location=job_location,
+                        description=description,
+                        url=job_url,
+                        salary_range=None,
+                        posted_date=None,
+                        job_type="Full-time",
+                        experience_level="Mid-Senior",
+                        source="LinkedIn",
+                        ma_relevance_score=relevance_score
+                    )
+                    jobs.append(job)
         except Exception as e:
             logger.error(f"Error scraping LinkedIn jobs: {e}")
         
         logger.info(f"Scraped {len(jobs)} M&A-relevant jobs from LinkedIn")
         return jobs
 
-    def scrape_indeed_jobs(self, keywords: List[str], location: str) -> List[MAJobListing]:
-        """Scrape M&A jobs from Indeed"""
-        jobs = []
+    def _scrape_linkedin_keyword(self, driver, keyword: str, location: str) -> List[tuple]:
+        """Collect (title, company, location, url) card metadata for one LinkedIn keyword"""
+        cards = []
+        search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&location={location}&distance=25"
+        driver.get(search_url)
+        try:
+            WebDriverWait(driver, 8).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".job-search-card"))
+            )
+        except TimeoutException:
+            logger.warning(f"No LinkedIn results rendered for '{keyword}'")
+            return cards
         
-        for keyword in keywords:
+        # Scroll to load more jobs, waiting on page growth instead of sleeping
+        for _ in range(3):
+            prev_height = driver.execute_script("return document.body.scrollHeight")
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             try:
-                # Indeed search URL
-                search_url = f"https://www.indeed.com/jobs?q={keyword}&l={location}&radius=25"
+                WebDriverWait(driver, 3).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") > prev_height
+                )
+            except TimeoutException:
+                break  # Nothing more loaded
+        
+        # Extract job listings
+        job_cards = driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
+        
+        for card in job_cards[:20]:  # Limit to first 20 results per keyword
+            try:
+                title = card.find_element(By.CSS_SELECTOR, ".base-search-card__title").text
+                company = card.find_element(By.CSS_SELECTOR, ".base-search-card__subtitle").text
                 
-                response = requests.get(search_url, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
+                key = (title.strip().lower(), company.strip().lower())
+                if key in self._seen_keys:
+                    continue
+                self._seen_keys.add(key)
                 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    job_cards = soup.find_all('div', class_='job_seen_beacon')
-                    
-                    for card in job_cards[:15]:  # Limit results
-                        try:
-                            title_elem = card.find('h2', class_='jobTitle')
-                            if not title_elem:
-                                continue
-                                
-                            title = title_elem.get_text(strip=True)
-                            
-                            company_elem = card.find('span', class_='companyName')
-                            company = company_elem.get_text(strip=True) if company_elem else ""
-                            
-                            location_elem = card.find('div', class_='companyLocation')
-                            job_location = location_elem.get_text(strip=True) if location_elem else ""
-                            
-                            # Get job URL
-                            link_elem = title_elem.find('a')
-                            job_url = f"https://www.indeed.com{link_elem['href']}" if link_elem else ""
-                            
-                            # Get job description
-                            description = self._get_indeed_job_description(job_url)
-                            
-                            # Calculate M&A relevance
-                            relevance_score = self._calculate_ma_relevance(title, description, company)
-                            
-                            if relevance_score >= 60:
-                                job = MAJobListing(
-                                    title=title,
-                                    company=company,
-                                    location=job_location,
-                                    description=description,
-                                    url=job_url,
-                                    salary_range=None,
-                                    posted_date=None,
-                                    job_type="Full-time",
-                                    experience_level="Mid-Senior",
-                                    source="Indeed",
-                                    ma_relevance_score=relevance_score
-                                )
-                                jobs.append(job)
-                                
-                        except Exception as e:
-                            logger.warning(f"Error extracting Indeed job: {e}")
-                            continue
+                location_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
+                job_location = location_elem.text if location_elem else ""
                 
-                time.sleep(1)  # Rate limiting
+                # Get job URL
+                link_elem = card.find_element(By.CSS_SELECTOR, ".base-card__full-link")
+                job_url = link_elem.get_attribute("href")
+                
+                cards.append((title, company, job_location, job_url))
                 
             except Exception as e:
-                logger.error(f"Error scraping Indeed for keyword '{keyword}': {e}")
+                logger.warning(f"Error extracting LinkedIn job: {e}")
+                continue
+        
+        return cards
+
+    def _fetch_linkedin_descriptions(self, urls: List[str]) -> Dict[str, str]:
+        """Fetch LinkedIn job descriptions in parallel across the driver pool"""
+        # Each distinct URL is fetched exactly once; anything already in the
+        # shared description cache never touches a driver again
+        unique_urls = [
+            url for url in dict.fromkeys(urls)
+            if url and url not in self._description_cache
+        ]
+        
+        if unique_urls:
+            pool = self._ensure_driver_pool()
+            
+            def fetch_one(url):
+                driver = pool.get()
+                try:
+                    return url, self._get_linkedin_job_description(driver, url)
+                finally:
+                    pool.put(driver)
+            
+            with ThreadPoolExecutor(max_workers=self.DRIVER_POOL_SIZE) as executor:
+                self._description_cache.update(executor.map(fetch_one, unique_urls))
+        
+        return {
+            url: self._description_cache[url]
+            for url in urls
+            if url in self._description_cache
+        }
+
+    def scrape_indeed_jobs(self, keywords: List[str], location: str) -> List[MAJobListing]:
+        """Scrape M&A jobs from Indeed"""
+        try:
+            jobs = asyncio.run(self._scrape_indeed_async(keywords, location))
+        except Exception as e:
+            logger.error(f"Error scraping Indeed jobs: {e}")
+            jobs = []
         
         logger.info(f"Scraped {len(jobs)} M&A-relevant jobs from Indeed")
         return jobs
 
-    def scrape_glassdoor_jobs(self, keywords: List[str], location: str) -> List[MAJobListing]:
-        """Scrape M&A jobs from Glassdoor"""
-        jobs = []
-        self.initialize_driver()
+    # Concurrency budgets per host; hosts not listed get the default
+    HOST_CONCURRENCY = {
+        'www.indeed.com': 8,
+        'www.glassdoor.com': 4,
+        'www.linkedin.com': 4,
+    }
+    DEFAULT_HOST_CONCURRENCY = 4
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str,
+                     semaphores: Dict[str, asyncio.Semaphore]) -> str:
+        """Fetch one page under its host's concurrency budget"""
+        host = urlsplit(url).netloc
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = semaphores[host] = asyncio.Semaphore(
+                self.HOST_CONCURRENCY.get(host, self.DEFAULT_HOST_CONCURRENCY)
+            )
         
-        try:
-            for keyword in keywords:
-                search_url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keyword}&locT=C&locId=1132348&radius=25"
-                self.driver.get(search_url)
-                time.sleep(3)
-                
-                # Handle potential popups
+        async with semaphore:
+            delay = 1.0
+            for _ in range(3):
                 try:
-                    close_button = self.driver.find_element(By.CSS_SELECTOR, "[data-test='modal-close']")
-                    close_button.click()
-                    time.sleep(1)
-                except:
-                    pass
+                    response = await client.get(url)
+                except httpx.HTTPError as e:
+                    logger.warning(f"Error fetching {url}: {e}")
+                    return ""
                 
-                # Extract job listings
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-test='job-listing']")
+                if response.status_code == 429:
+                    # Honor Retry-After when given, otherwise back off exponentially
+                    retry_after = response.headers.get('Retry-After', '')
+                    wait = float(retry_after) if retry_after.isdigit() else delay
+                    logger.warning(f"Rate limited by {host}; waiting {wait:.0f}s")
+                    await asyncio.sleep(wait)
+                    delay *= 2
+                    continue
                 
-                for card in job_cards[:10]:  # Limit results
+                if response.status_code == 200:
+                    # Ease off before the host's quota runs dry
+                    remaining = response.headers.get('X-RateLimit-Remaining', '')
+                    if remaining.isdigit() and int(remaining) < 5:
+                        await asyncio.sleep(1.0)
+                    return response.text
+                return ""
+        return ""
+
+    async def _scrape_indeed_async(self, keywords: List[str], location: str) -> List[MAJobListing]:
+        """Fetch Indeed search pages and job descriptions concurrently"""
+        jobs = []
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        
+        async with httpx.AsyncClient(
+            limits=limits,
+            timeout=15,
+            follow_redirects=True,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+        ) as client:
+            # All keyword searches go out together, gated by the semaphore
+            search_urls = [
+                f"https://www.indeed.com/jobs?q={keyword}&l={location}&radius=25"
+                for keyword in keywords
+            ]
+            pages = await asyncio.gather(
+                *[self._fetch(client, url, semaphores) for url in search_urls]
+            )
+            
+            # Parse the cards first, then fan out the description fetches
+            pending = []
+            for page in pages:
+                if not page:
+                    continue
+                
+                soup = BeautifulSoup(page, 'lxml', parse_only=_JOB_CARD_STRAINER)
+                job_cards = soup.find_all('div', class_='job_seen_beacon')
+                
+                for card in job_cards[:15]:  # Limit results
                     try:
-                        title_elem = card.find_element(By.CSS_SELECTOR, "[data-test='job-title']")
-                        title = title_elem.text
+                        title_elem = card.find('h2', class_='jobTitle')
+                        if not title_elem:
+                            continue
                         
-                        company_elem = card.find_element(By.CSS_SELECTOR, "[data-test='employer-name']")
-                        company = company_elem.text
+                        title = title_elem.get_text(strip=True)
                         
-                        location_elem = card.find_element(By.CSS_SELECTOR, "[data-test='job-location']")
-                        job_location = location_elem.text
+                        company_elem = card.find('span', class_='companyName')
+                        company = company_elem.get_text(strip=True) if company_elem else ""
                         
-                        # Get job URL
-                        job_url = title_elem.get_attribute("href")
+                        key = (title.strip().lower(), company.strip().lower())
+                        if key in self._seen_keys:
+                            continue
+                        self._seen_keys.add(key)
                         
-                        # Get description (simplified for demo)
-                        description = f"M&A role at {company} in {job_location}"
+                        location_elem = card.find('div', class_='companyLocation')
+                        job_location = location_elem.get_text(strip=True) if location_elem else ""
                         
-                        # Calculate relevance
-                        relevance_score = self._calculate_ma_relevance(title, description, company)
+                        # Get job URL
+                        link_elem = title_elem.find('a')
+                        job_url = f"https://www.indeed.com{link_elem['href']}" if link_elem else ""
+                        
+                        pending.append((title, company, job_location, job_url))
                         
-                        if relevance_score >= 60:
-                            job = MAJobListing(
-                                title=title,
-                                company=company,
-                                location=job_location,
-                                description=description,
-                                url=job_url,
-                                salary_range=None,
-                                posted_date=None,
-                                job_type="Full-time",
-                                experience_level="Mid-Senior",
-                                source="Glassdoor",
-                                ma_relevance_score=relevance_score
-                            )
-                            jobs.append(job)
-                            
                     except Exception as e:
-                        logger.warning(f"Error extracting Glassdoor job: {e}")
+                        logger.warning(f"Error extracting Indeed job: {e}")
                         continue
-                
-                time.sleep(2)
-                
+            
+            # Fetch each distinct, uncached URL exactly once
+            unique_urls = [
+                url for url in {job_url for _, _, _, job_url in pending if job_url}
+                if url not in self._description_cache
+            ]
+            detail_pages = await asyncio.gather(
+                *[self._fetch(client, url, semaphores) for url in unique_urls]
+            )
+            for url, detail_html in zip(unique_urls, detail_pages):
+                self._description_cache[url] = self._parse_indeed_description(detail_html)
+        
+        for title, company, job_location, job_url in pending:
+            description = self._description_cache.get(job_url, "")
+            
+            # Calculate M&A relevance
+            relevance_score = self._calculate_ma_relevance(title, description, company)
+            
+            if relevance_score >= 60:
+                jobs.append(MAJobListing(
+                    title=title,
+                    company=company,
+                    location=job_location,
+                    description=description,
+                    url=job_url,
+                    salary_range=None,
+                    posted_date=None,
+                    job_type="Full-time",
+                    experience_level="Mid-Senior",
+                    source="Indeed",
+                    ma_relevance_score=relevance_score
+                ))
+        
+        return jobs
+
+    def scrape_glassdoor_jobs(self, keywords: List[str], location: str) -> List[MAJobListing]:
+        """Scrape M&A jobs from Glassdoor"""
+        jobs = []
+        
+        try:
+            for keyword in keywords:
+                jobs.extend(self._scrape_glassdoor_keyword(keyword))
         except Exception as e:
             logger.error(f"Error scraping Glassdoor jobs: {e}")
         
         logger.info(f"Scraped {len(jobs)} M&A-relevant jobs from Glassdoor")
         return jobs
 
-    def _get_linkedin_job_description(self, job_url: str) -> str:
+    def _scrape_glassdoor_keyword(self, keyword: str) -> List[MAJobListing]:
+        """Scrape one Glassdoor keyword search over plain HTTP"""
+        jobs = []
+        response = self.http.get(
+            "https://www.glassdoor.com/Job/jobs.htm",
+            params={
+                'sc.keyword': keyword,
+                'locT': 'C',
+                'locId': '1132348',
+                'radius': self.search_radius
+            },
+            timeout=10
+        )
+        if response.status_code != 200:
+            logger.warning(f"Glassdoor search returned {response.status_code} for '{keyword}'")
+            return jobs
+        
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=_GLASSDOOR_CARD_STRAINER)
+        job_cards = soup.find_all(attrs={'data-test': 'job-listing'})
+        
+        for card in job_cards[:10]:  # Limit results
+            try:
+                title_elem = card.find(attrs={'data-test': 'job-title'})
+                if not title_elem:
+                    continue
+                title = title_elem.get_text(strip=True)
+                
+                company_elem = card.find(attrs={'data-test': 'employer-name'})
+                company = company_elem.get_text(strip=True) if company_elem else ""
+                
+                key = (title.strip().lower(), company.strip().lower())
+                if key in self._seen_keys:
+                    continue
+                self._seen_keys.add(key)
+                
+                location_elem = card.find(attrs={'data-test': 'job-location'})
+                job_location = location_elem.get_text(strip=True) if location_elem else ""
+                
+                # Get job URL
+                job_url = title_elem.get('href', '')
+                if job_url.startswith('/'):
+                    job_url = f"https://www.glassdoor.com{job_url}"
+                
+                # Get description (simplified for demo)
+                description = f"M&A role at {company} in {job_location}"
+                
+                # Calculate relevance
+                relevance_score = self._calculate_ma_relevance(title, description, company)
+                
+                if relevance_score >= 60:
+                    job = MAJobListing(
+                        title=title,
+                        company=company,
+                        location=job_location,
+                        description=description,
+                        url=job_url,
+                        salary_range=None,
+                        posted_date=None,
+                        job_type="Full-time",
+                        experience_level="Mid-Senior",
+                        source="Glassdoor",
+                        ma_relevance_score=relevance_score
+                    )
+                    jobs.append(job)
+                    
+            except Exception as e:
+                logger.warning(f"Error extracting Glassdoor job: {e}")
+                continue
+        
+        return jobs
+
+    def _get_linkedin_job_description(self, driver, job_url: str) -> str:
         """Get detailed job description from LinkedIn job page"""
         try:
-            self.driver.get(job_url)
-            time.sleep(2)
+            driver.get(job_url)
             
-            # Try to find job description
-            description_elem = self.driver.find_element(By.CSS_SELECTOR, ".show-more-less-html__markup")
+            # Wait for the description instead of sleeping a fixed interval
+            description_elem = WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".show-more-less-html__markup"))
+            )
             return description_elem.text
             
         except Exception as e:
@@ -294,65 +563,81 @@ class MAJobScraper:
 
     def _get_indeed_job_description(self, job_url: str) -> str:
         """Get detailed job description from Indeed job page"""
+        cached = self._description_cache.get(job_url)
+        if cached is not None:
+            return cached
+        
+        description = ""
         try:
-            response = requests.get(job_url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            response = self.http.get(job_url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                desc_elem = soup.find('div', class_='jobsearch-jobDescriptionText')
-                return desc_elem.get_text(strip=True) if desc_elem else ""
+                description = self._parse_indeed_description(response.text)
                 
         except Exception as e:
             logger.warning(f"Could not get Indeed job description: {e}")
-            
-        return ""
+        
+        self._description_cache[job_url] = description
+        return description
+
+    @staticmethod
+    def _parse_indeed_description(html: str) -> str:
+        """Extract the description text from an Indeed job page"""
+        if not html:
+            return ""
+        soup = BeautifulSoup(html, 'lxml', parse_only=_DESCRIPTION_STRAINER)
+        desc_elem = soup.find('div', class_='jobsearch-jobDescriptionText')
+        return desc_elem.get_text(strip=True) if desc_elem else ""
 
     def _calculate_ma_relevance(self, title: str, description: str, company: str) -> float:
         """Calculate M&A relevance score for a job listing"""
+        cache_key = (title, company, hash(description))
+        cached = self._relevance_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         score = 0.0
         title_lower = title.lower()
         desc_lower = description.lower()
         company_lower = company.lower()
         
         # Title scoring (40% weight)
-        ma_title_keywords = ['m&a', 'merger', 'acquisition', 'investment banking', 'corporate finance', 'private equity']
-        for keyword in ma_title_keywords:
-            if keyword in title_lower:
-                score += 10
+        score += 10 * len(set(self._title_pattern.findall(title_lower)))
         
         # Description scoring (40% weight)
-        ma_desc_keywords = [
-            'due diligence', 'financial modeling', 'valuation', 'dcf', 'lbo',
-            'leveraged buyout', 'deal', 'transaction', 'synergy', 'integration'
-        ]
-        for keyword in ma_desc_keywords:
-            if keyword in desc_lower:
-                score += 4
+        score += 4 * len(set(self._desc_pattern.findall(desc_lower)))
         
         # Company scoring (20% weight)
-        for category, companies in self.target_companies.items():
-            for target_company in companies:
-                if target_company.lower() in company_lower:
-                    score += 20
-                    break
+        if self._company_pattern.search(company_lower):
+            score += 20
         
-        return min(score, 100)  # Cap at 100
+        score = min(score, 100)  # Cap at 100
+        self._relevance_cache[cache_key] = score
+        return score
 
     def get_all_ma_jobs(self) -> List[MAJobListing]:
         """Aggregate M&A jobs from all sources"""
         all_jobs = []
         location = f"{self.target_location}, NY"
         
-        # Scrape from multiple sources
-        linkedin_jobs = self.scrape_linkedin_jobs(self.ma_keywords[:3], location)  # Limit keywords to avoid rate limiting
-        indeed_jobs = self.scrape_indeed_jobs(self.ma_keywords[:3], location)
-        glassdoor_jobs = self.scrape_glassdoor_jobs(self.ma_keywords[:2], location)
+        # Dedup and description caches are per run; a scraper held by a
+        # long-lived scheduled manager must not skip listings it saw on an
+        # earlier day
+        self._seen_keys.clear()
+        self._description_cache.clear()
         
-        all_jobs.extend(linkedin_jobs)
-        all_jobs.extend(indeed_jobs)
-        all_jobs.extend(glassdoor_jobs)
+        try:
+            # Scrape from multiple sources; only LinkedIn needs the lazily
+            # started driver pool
+            linkedin_jobs = self.scrape_linkedin_jobs(self.ma_keywords[:3], location)  # Limit keywords to avoid rate limiting
+            indeed_jobs = self.scrape_indeed_jobs(self.ma_keywords[:3], location)
+            glassdoor_jobs = self.scrape_glassdoor_jobs(self.ma_keywords[:2], location)
+            
+            all_jobs.extend(linkedin_jobs)
+            all_jobs.extend(indeed_jobs)
+            all_jobs.extend(glassdoor_jobs)
+        finally:
+            self.cleanup()
         
         # Remove duplicates based on title and company
         unique_jobs = []
@@ -364,38 +649,77 @@ class MAJobScraper:
                 seen.add(job_key)
                 unique_jobs.append(job)
         
+        # Re-score the surviving listings in one vectorized pass so the final
+        # ranking comes from a single C-level scan per keyword
+        if unique_jobs:
+            scores = self._score_jobs_batch(unique_jobs)
+            for job, score in zip(unique_jobs, scores):
+                job.ma_relevance_score = float(min(int(score), 100))
+        
         # Sort by M&A relevance score
         unique_jobs.sort(key=lambda x: x.ma_relevance_score, reverse=True)
         
         logger.info(f"Found {len(unique_jobs)} unique M&A job opportunities")
         return unique_jobs
 
-    def save_jobs_to_json(self, jobs: List[MAJobListing], filename: str = "ma_jobs.json"):
-        """Save job listings to JSON file"""
-        jobs_data = []
-        for job in jobs:
-            jobs_data.append({
-                'title': job.title,
-                'company': job.company,
-                'location': job.location,
-                'description': job.description,
-                'url': job.url,
-                'salary_range': job.salary_range,
-                'posted_date': job.posted_date,
-                'job_type': job.job_type,
-                'experience_level': job.experience_level,
-                'source': job.source,
-                'ma_relevance_score': job.ma_relevance_score,
-                'scraped_at': datetime.now().isoformat()
-            })
+    def _score_jobs_batch(self, jobs: List[MAJobListing]) -> np.ndarray:
+        """Score every listing at once with per-keyword vector scans"""
+        titles = np.array([job.title.lower() for job in jobs], dtype=str)
+        descriptions = np.array([job.description.lower() for job in jobs], dtype=str)
+        companies = np.array([job.company.lower() for job in jobs], dtype=str)
+        
+        scores = np.zeros(len(jobs), dtype=np.int32)
+        for keyword in self.ma_title_keywords:
+            scores += 10 * (np.char.find(titles, keyword) >= 0)
+        for keyword in self.ma_desc_keywords:
+            scores += 4 * (np.char.find(descriptions, keyword) >= 0)
+        
+        company_hit = np.zeros(len(jobs), dtype=bool)
+        for name in self._target_companies_lower:
+            company_hit |= np.char.find(companies, name) >= 0
+        scores += 20 * company_hit
+        
+        return scores
+
+    def save_jobs_to_json(self, jobs: List[MAJobListing], filename: str = "ma_jobs.jsonl"):
+        """Save job listings as JSON Lines, one job per line"""
+        scraped_at = datetime.now().isoformat()
         
+        def rows():
+            for job in jobs:
+                yield {
+                    'title': job.title,
+                    'company': job.company,
+                    'location': job.location,
+                    'description': job.description,
+                    'url': job.url,
+                    'salary_range': job.salary_range,
+                    'posted_date': job.posted_date,
+                    'job_type': job.job_type,
+                    'experience_level': job.experience_level,
+                    'source': job.source,
+                    'ma_relevance_score': job.ma_relevance_score,
+                    'scraped_at': scraped_at
+                }
+        
+        # Stream one compact object per line rather than materializing the
+        # whole list and pretty-printing it in one allocation
         with open(f"data_folder/output/{filename}", 'w') as f:
-            json.dump(jobs_data, f, indent=2)
+            for row in rows():
+                f.write(json.dumps(row, separators=(',', ':')))
+                f.write('\n')
         
         logger.info(f"Saved {len(jobs)} M&A jobs to {filename}")
 
     def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
-            logger.info("WebDriver closed")
\ No newline at end of file
+        """Clean up resources; safe to call more than once"""
+        self.http.close()
+        if self._driver_pool is not None:
+            pool, self._driver_pool = self._driver_pool, None
+            while not pool.empty():
+                driver = pool.get_nowait()
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Error closing WebDriver: {e}")
+            logger.info("WebDriver pool closed")
\ No newline at end of file
@@ -2,14 +2,51 @@
 M&A Resume Optimization Module
 Specialized resume tailoring for Mergers & Acquisitions roles
 """
+import os
 import re
-from typing import Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, List, Set, Tuple
 from src.logging import logger
 from src.resume_schemas.resume import Resume
 
+# Four-digit years as they appear in employment periods
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# One optimizer per worker process, built lazily on first use so the pool
+# pays the construction cost once instead of pickling state per task
+_worker_optimizer = None
+
+def _optimize_one(pair: tuple) -> Dict:
+    """Worker-side optimization of one (resume, job_description) pair"""
+    global _worker_optimizer
+    if _worker_optimizer is None:
+        _worker_optimizer = MAResumeOptimizer()
+    resume, job_description = pair
+    return _worker_optimizer.optimize_resume_for_ma_job(resume, job_description)
+
 class MAResumeOptimizer:
     """Optimize resumes specifically for M&A job applications"""
     
+    # Below this many pairs the pool start-up costs more than it saves
+    PARALLEL_BATCH_THRESHOLD = 8
+    
+    # Resumes whose serialized text is kept around; batch use sees one or
+    # a handful of distinct Resume objects
+    RESUME_TEXT_CACHE_SIZE = 8
+    
+    # Generic phrasing upgraded to M&A-specific language when the job's
+    # keywords call for it
+    _responsibility_replacements = {
+        'financial analysis': 'M&A financial analysis and due diligence',
+        'analysis': 'valuation analysis',
+        'models': 'financial models including DCF and LBO analyses',
+        'presentations': 'pitch books and management presentations',
+        'clients': 'M&A clients and strategic buyers',
+        'deals': 'M&A transactions',
+        'projects': 'M&A deal execution projects'
+    }
+    
     def __init__(self):
         self.ma_skill_keywords = {
             'technical': {
@@ -38,6 +75,23 @@ class MAResumeOptimizer:
             'managed', 'led', 'developed', 'created', 'built', 'designed',
             'negotiated', 'advised', 'presented', 'coordinated', 'facilitated'
         }
+        
+        # One alternation over every generic term, longest first so
+        # 'financial analysis' wins over the bare 'analysis'
+        self._replacement_pattern = re.compile(
+            '|'.join(
+                re.escape(generic)
+                for generic in sorted(self._responsibility_replacements, key=len, reverse=True)
+            ),
+            re.IGNORECASE
+        )
+        
+        # Normalized resume text, memoized per Resume object so scoring a
+        # batch of jobs against one resume serializes it only once. Entries
+        # keep a strong reference to their Resume: Resume is an unhashable
+        # pydantic model, and holding the object keeps its id from being
+        # recycled onto a different resume while the entry lives.
+        self._resume_text_cache: Dict[int, Tuple[Resume, str]] = {}
 
     def extract_job_keywords(self, job_description: str) -> Set[str]:
         """Extract relevant keywords from M&A job description"""
@@ -96,22 +150,22 @@ class MAResumeOptimizer:
 
     def _enhance_responsibility_text(self, text: str, target_keywords: Set[str]) -> str:
         """Enhance responsibility text with M&A-specific terminology"""
-        enhanced_text = text
-        
-        # Replace generic terms with M&A-specific ones
-        replacements = {
-            'financial analysis': 'M&A financial analysis and due diligence',
-            'analysis': 'valuation analysis',
-            'models': 'financial models including DCF and LBO analyses',
-            'presentations': 'pitch books and management presentations',
-            'clients': 'M&A clients and strategic buyers',
-            'deals': 'M&A transactions',
-            'projects': 'M&A deal execution projects'
+        # Generic terms whose replacement is backed by the job's keywords
+        active = {
+            generic
+            for generic, specific in self._responsibility_replacements.items()
+            if any(kw in target_keywords for kw in specific.split())
         }
         
-        for generic, specific in replacements.items():
-            if generic in text.lower() and any(kw in target_keywords for kw in specific.split()):
-                enhanced_text = re.sub(re.escape(generic), specific, enhanced_text, flags=re.IGNORECASE)
+        def replace(match):
+            generic = match.group(0).lower()
+            if generic in active:
+                return self._responsibility_replacements[generic]
+            return match.group(0)
+        
+        # One linear pass with the precompiled alternation instead of a
+        # re.sub per replacement key
+        enhanced_text = self._replacement_pattern.sub(replace, text)
         
         # Add quantifiable metrics where possible
         if 'transaction' in enhanced_text.lower() and '$' not in enhanced_text:
@@ -121,7 +175,8 @@ class MAResumeOptimizer:
 
     def _enhance_skills_list(self, skills: List[str], target_keywords: Set[str]) -> List[str]:
         """Enhance skills list with M&A-relevant skills"""
-        enhanced_skills = skills.copy()
+        enhanced_skills = list(skills)
+        existing = set(enhanced_skills)
         
         # Add M&A-specific skills that match target keywords
         ma_skills_to_add = [
@@ -134,9 +189,12 @@ class MAResumeOptimizer:
         ]
         
         for skill in ma_skills_to_add:
+            if skill in existing:
+                continue
             skill_keywords = skill.lower().split()
-            if any(kw in target_keywords for kw in skill_keywords) and skill not in enhanced_skills:
+            if any(kw in target_keywords for kw in skill_keywords):
                 enhanced_skills.append(skill)
+                existing.add(skill)
         
         return enhanced_skills
 
@@ -210,17 +268,14 @@ class MAResumeOptimizer:
             return 0
         
         # Handle various date formats
+        years = _YEAR_RE.findall(period)
+        
         period_lower = period.lower()
         if 'present' in period_lower or 'current' in period_lower:
-            # Extract start year and calculate to present
-            years = re.findall(r'\b(19|20)\d{2}\b', period)
+            # Calculate from start year to today
             if years:
-                start_year = int(years[0])
-                current_year = 2024  # Update as needed
-                return current_year - start_year
+                return date.today().year - int(years[0])
         
-        # Extract all years from the period
-        years = re.findall(r'\b(19|20)\d{2}\b', period)
         if len(years) >= 2:
             return int(years[-1]) - int(years[0])
         
@@ -249,13 +304,41 @@ class MAResumeOptimizer:
         logger.info(f"Resume optimized for M&A role with score: {optimized_resume['optimization_score']}")
         return optimized_resume
 
+    def _resume_text(self, resume: Resume) -> str:
+        """Lowered text form of the resume, serialized once per object"""
+        key = id(resume)
+        cached = self._resume_text_cache.get(key)
+        if cached is not None and cached[0] is resume:
+            return cached[1]
+        
+        text = str(resume).lower()
+        if len(self._resume_text_cache) >= self.RESUME_TEXT_CACHE_SIZE:
+            # Drop the oldest entry so the cache stays bounded
+            self._resume_text_cache.pop(next(iter(self._resume_text_cache)))
+        self._resume_text_cache[key] = (resume, text)
+        return text
+
+    def optimize_batch(self, pairs: List[Tuple[Resume, str]]) -> List[Dict]:
+        """Optimize many (resume, job_description) pairs, in parallel when large"""
+        if not pairs:
+            return []
+        
+        if len(pairs) < self.PARALLEL_BATCH_THRESHOLD:
+            return [
+                self.optimize_resume_for_ma_job(resume, job_description)
+                for resume, job_description in pairs
+            ]
+        
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(_optimize_one, pairs, chunksize=4))
+
     def _calculate_optimization_score(self, resume: Resume, target_keywords: Set[str]) -> float:
         """Calculate how well the resume matches M&A job requirements"""
         if not target_keywords:
             return 0.0
         
         # Count keyword matches in resume
-        resume_text = str(resume).lower()
+        resume_text = self._resume_text(resume)
         matches = sum(1 for keyword in target_keywords if keyword in resume_text)
         
         # Calculate percentage match